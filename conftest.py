@@ -0,0 +1,20 @@
+import os
+
+from hypothesis import HealthCheck, settings
+
+
+# Django model generation is slow and its draws can be large, so those health
+# checks and the per-example deadline are disabled in every profile. The
+# remaining health checks still catch strategies that filter out too much.
+slow_django_models = dict(
+    suppress_health_check=[HealthCheck.too_slow, HealthCheck.data_too_large],
+    deadline=None)
+
+settings.register_profile(
+    'dev', settings(max_examples=10, **slow_django_models))
+settings.register_profile(
+    'ci', settings(max_examples=25, **slow_django_models))
+settings.register_profile(
+    'jumbo', settings(max_examples=500, **slow_django_models))
+
+settings.load_profile(os.environ.get('HYPOTHESIS_PROFILE', 'dev'))
@@ -1,6 +1,8 @@
 import requests
 import urllib
 
+from requests.adapters import HTTPAdapter
+
 from django.db import models
 from django.conf import settings
 from django.utils.translation import ugettext_lazy as _
@@ -13,6 +15,41 @@ from mc2.controllers.base.managers import (
     ControllerInfrastructureManager, ControllerRabbitMQManager)
 
 
+# A shared session so that consecutive calls to Marathon and Xylem reuse
+# kept-alive connections rather than opening a new one per request.
+http_session = requests.Session()
+http_session.mount(
+    'http://', HTTPAdapter(pool_connections=16, pool_maxsize=64))
+http_session.mount(
+    'https://', HTTPAdapter(pool_connections=16, pool_maxsize=64))
+
+MARATHON_APPS_URL = '%s/v2/apps'
+MARATHON_APP_URL = MARATHON_APPS_URL + '/%s'
+MARATHON_APP_RESTART_URL = MARATHON_APP_URL + '/restart'
+
+
+def error_message(resp, *keys):
+    """
+    Returns the error message from an API response, falling back to the
+    start of the raw body when the response isn't JSON (e.g. a proxy's HTML
+    error page).
+
+    :param resp requests.Response: The failed response
+    :param keys str: The path of keys to the message in the JSON body,
+        defaults to ``message``
+    :returns: str
+    """
+    try:
+        data = resp.json()
+    except ValueError:
+        return resp.text[:256]
+
+    keys = keys or ('message',)
+    for key in keys[:-1]:
+        data = data.get(key, {})
+    return data.get(keys[-1])
+
+
 class Controller(PolymorphicModel):
     # state
     marathon_cpus = models.FloatField(
@@ -87,6 +124,11 @@ class Controller(PolymorphicModel):
         self.rabbitmq_manager = ControllerRabbitMQManager(self)
 
     def save(self, *args, **kwargs):
+        # Saves restricted to other fields can't persist a slug anyway.
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'slug' not in update_fields:
+            return super(Controller, self).save(*args, **kwargs)
+
         if not self.slug:
             self.slug = namers.do_me_a_unique_slug(self.__class__, 'slug')
         super(Controller, self).save(*args, **kwargs)
@@ -115,7 +157,7 @@ class Controller(PolymorphicModel):
         return Builder(self)
 
     def get_or_create_postgres_db(self):
-        resp = requests.post(
+        resp = http_session.post(
             '%s/queues/postgres/wait/create_database'
             % settings.SEED_XYLEM_API_HOST, json={
                 'name': self.app_id.replace('-', '_')})
@@ -123,7 +165,7 @@ class Controller(PolymorphicModel):
         if resp.status_code != 200:
             raise exceptions.XylemApiException(
                 'Create Postgres DB app failed with response: %s - %s' %
-                (resp.status_code, resp.json().get('result', {}).get('Err')))
+                (resp.status_code, error_message(resp, 'result', 'Err')))
 
         result = resp.json().get('result')
         if not result:
@@ -158,22 +200,19 @@ class Controller(PolymorphicModel):
         if self.marathon_cmd:
             data.update({"cmd": self.marathon_cmd})
 
-        envs = {}
-        if self.env_variables.exists():
-            envs = dict([
-                (env.key, env.value)
-                for env in self.env_variables.all()])
+        envs = dict([
+            (env.key, env.value)
+            for env in self.env_variables.all()])
 
         if self.postgres_db_needed:
             self.get_or_create_postgres_db()
             envs.update({
-                'DATABASE_URL': 'postgres://%(username)s:'
-                '%(password)s@%(host)s/%(name)s' % {
-                    'username': self.postgres_db_username,
-                    'password': self.postgres_db_password,
-                    'host': self.postgres_db_host,
-                    'name': self.postgres_db_name,
-                }})
+                'DATABASE_URL': 'postgres://%s:%s@%s/%s' % (
+                    self.postgres_db_username,
+                    self.postgres_db_password,
+                    self.postgres_db_host,
+                    self.postgres_db_name,
+                )})
         else:
             self.postgres_db_username = None
             self.postgres_db_password = None
@@ -184,14 +223,12 @@ class Controller(PolymorphicModel):
         if self.rabbitmq_vhost_needed and self.rabbitmq_vhost_name:
             self.rabbitmq_manager.create_rabbitmq_vhost()
             envs.update({
-                'BROKER_URL':
-                    'amqp://%(username)s:%(password)s@%(host)s/%(name)s' %
-                    {
-                        'username': self.rabbitmq_vhost_username,
-                        'password': self.rabbitmq_vhost_password,
-                        'host': self.rabbitmq_vhost_host,
-                        'name': urllib.quote(self.rabbitmq_vhost_name),
-                    }
+                'BROKER_URL': 'amqp://%s:%s@%s/%s' % (
+                    self.rabbitmq_vhost_username,
+                    self.rabbitmq_vhost_password,
+                    self.rabbitmq_vhost_host,
+                    urllib.quote(self.rabbitmq_vhost_name),
+                )
             })
 
             # TODO: seed-xylem currently doesn't support deleting of databases
@@ -203,9 +240,8 @@ class Controller(PolymorphicModel):
         service_labels = self.get_default_app_labels()
 
         # Update custom labels
-        if self.label_variables.exists():
-            for label in self.label_variables.all():
-                service_labels[label.name] = label.value
+        for label in self.label_variables.all():
+            service_labels[label.name] = label.value
 
         data.update({'labels': service_labels})
 
@@ -213,62 +249,51 @@ class Controller(PolymorphicModel):
 
     def create_marathon_app(self):
         post_data = self.get_marathon_app_data()
-        resp = requests.post(
-            '%s/v2/apps' % settings.MESOS_MARATHON_HOST,
+        resp = http_session.post(
+            MARATHON_APPS_URL % settings.MESOS_MARATHON_HOST,
             json=post_data)
 
         if resp.status_code != 201:
             raise exceptions.MarathonApiException(
                 'Create Marathon app failed with response: %s - %s' %
-                (resp.status_code, resp.json().get('message')))
+                (resp.status_code, error_message(resp)))
 
     def update_marathon_app(self):
         post_data = self.get_marathon_app_data()
         app_id = post_data.pop('id')
-        resp = requests.put(
-            '%(host)s/v2/apps/%(id)s' % {
-                'host': settings.MESOS_MARATHON_HOST,
-                'id': app_id
-            },
+        resp = http_session.put(
+            MARATHON_APP_URL % (settings.MESOS_MARATHON_HOST, app_id),
             json=post_data)
 
         if resp.status_code not in [200, 201]:
             raise exceptions.MarathonApiException(
                 'Update Marathon app failed with response: %s - %s' %
-                (resp.status_code, resp.json().get('message')))
+                (resp.status_code, error_message(resp)))
 
     def marathon_restart_app(self):
-        resp = requests.post(
-            '%(host)s/v2/apps/%(id)s/restart' % {
-                'host': settings.MESOS_MARATHON_HOST,
-                'id': self.app_id
-            },
+        resp = http_session.post(
+            MARATHON_APP_RESTART_URL % (
+                settings.MESOS_MARATHON_HOST, self.app_id),
             json={})
 
         if resp.status_code != 200:
             raise exceptions.MarathonApiException(
                 'Restart Marathon app failed with response: %s - %s' %
-                (resp.status_code, resp.json().get('message')))
+                (resp.status_code, error_message(resp)))
 
     def marathon_destroy_app(self):
-        resp = requests.delete(
-            '%(host)s/v2/apps/%(id)s' % {
-                'host': settings.MESOS_MARATHON_HOST,
-                'id': self.app_id
-            },
+        resp = http_session.delete(
+            MARATHON_APP_URL % (settings.MESOS_MARATHON_HOST, self.app_id),
             json={})
 
         if resp.status_code != 200:
             raise exceptions.MarathonApiException(
                 'Marathon app deletion failed with response: %s - %s' %
-                (resp.status_code, resp.json().get('message')))
+                (resp.status_code, error_message(resp)))
 
     def exists_on_marathon(self):
-        resp = requests.get(
-            '%(host)s/v2/apps/%(id)s' % {
-                'host': settings.MESOS_MARATHON_HOST,
-                'id': self.app_id
-            },
+        resp = http_session.get(
+            MARATHON_APP_URL % (settings.MESOS_MARATHON_HOST, self.app_id),
             json={})
         return resp.status_code == 200
 
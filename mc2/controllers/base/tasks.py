@@ -21,7 +21,7 @@ def update_marathon_app(project_id):
 def marathon_restart_app(project_id):
     from mc2.controllers.base.models import Controller
 
-    controller = Controller.objects.get(pk=project_id)
+    controller = Controller.objects.non_polymorphic().get(pk=project_id)
     controller.marathon_restart_app()
 
 
@@ -1,13 +1,73 @@
 import json
 import responses
 
+from importlib import import_module
+
+from django.contrib.auth import login
+from django.http import HttpRequest
 from django.test import TransactionTestCase
+from django.test.client import Client
 from django.conf import settings
 
 from mc2.controllers.base.models import Controller, EnvVariable, MarathonLabel
 
 
+class ForceLoginClient(Client):
+    """
+    A test client with a backport of Django 1.9's ``Client.force_login()``.
+
+    Logging in this way skips authentication, so tests don't pay for
+    password hashing on every login.
+    """
+
+    def force_login(
+            self, user, backend='django.contrib.auth.backends.ModelBackend'):
+        user.backend = backend
+
+        request = HttpRequest()
+        if self.session:
+            request.session = self.session
+        else:
+            engine = import_module(settings.SESSION_ENGINE)
+            request.session = engine.SessionStore()
+        login(request, user)
+        request.session.save()
+
+        session_cookie = settings.SESSION_COOKIE_NAME
+        self.cookies[session_cookie] = request.session.session_key
+        self.cookies[session_cookie].update({
+            'max-age': None,
+            'path': '/',
+            'domain': settings.SESSION_COOKIE_DOMAIN,
+            'secure': settings.SESSION_COOKIE_SECURE or None,
+            'expires': None,
+        })
+
+
+class ResponsesMixin(object):
+    """
+    Patches requests with ``responses`` once for the whole test class rather
+    than around every test method. Mocks registered by a test are cleared
+    after it.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        super(ResponsesMixin, cls).setUpClass()
+        responses.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        responses.stop()
+        super(ResponsesMixin, cls).tearDownClass()
+
+    def tearDown(self):
+        responses.reset()
+        super(ResponsesMixin, self).tearDown()
+
+
 class ControllerBaseTestCase(TransactionTestCase):
+    client_class = ForceLoginClient
 
     def mk_controller(self, controller={}):
         controller_defaults = {
@@ -2,19 +2,21 @@ import responses
 import pytest
 
 from django.contrib.auth.models import User
+from django.test import TestCase
 
-from mc2.controllers.base.tests.base import ControllerBaseTestCase
+from mc2.controllers.base.tests.base import (
+    ControllerBaseTestCase, ResponsesMixin)
 from mc2.controllers.base import exceptions
 
 
 @pytest.mark.django_db
-class ControllerTestCase(ControllerBaseTestCase):
+class ControllerTestCase(ResponsesMixin, TestCase, ControllerBaseTestCase):
     fixtures = ['test_users.json', 'test_social_auth.json']
 
-    def setUp(self):
-        self.user = User.objects.get(username='testuser')
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.get(username='testuser')
 
-    @responses.activate
     def test_create_controller_state(self):
         self.mock_create_marathon_app()
 
@@ -25,7 +27,6 @@ class ControllerTestCase(ControllerBaseTestCase):
         self.assertEquals(p.state, 'done')
         self.assertEqual(len(responses.calls), 1)
 
-    @responses.activate
     def test_create_marathon_app_bad_response(self):
         self.mock_create_marathon_app(404)
 
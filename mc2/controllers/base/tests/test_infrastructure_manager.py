@@ -1,5 +1,3 @@
-import responses
-
 from django.test import TestCase
 from django.contrib.auth import get_user_model
 
@@ -7,10 +5,11 @@ from mc2.controllers.base.managers.infrastructure import (
     GeneralInfrastructureManager, InfrastructureError)
 from mc2.controllers.base.models import Controller
 
+from mc2.controllers.base.tests.base import ResponsesMixin
 from mc2.controllers.base.tests.utils import setup_responses_for_log_tests
 
 
-class GeneralInfrastructureManagerTest(TestCase):
+class GeneralInfrastructureManagerTest(ResponsesMixin, TestCase):
 
     def setUp(self):
         User = get_user_model()
@@ -23,12 +22,10 @@ class GeneralInfrastructureManagerTest(TestCase):
         self.general_im = GeneralInfrastructureManager()
         self.controller_im = self.controller.infra_manager
 
-    @responses.activate
     def test_get_marathon_app(self):
         app = self.general_im.get_marathon_app(self.controller.app_id)
         self.assertEqual(app['id'], '/%s' % (self.controller.app_id,))
 
-    @responses.activate
     def test_get_marathon_app_tasks(self):
         [task] = self.general_im.get_marathon_app_tasks(self.controller.app_id)
         self.assertEqual(task['appId'], '/%s' % (self.controller.app_id,))
@@ -37,18 +34,15 @@ class GeneralInfrastructureManagerTest(TestCase):
         self.assertEqual(task['ports'], [8898])
         self.assertEqual(task['host'], 'worker-machine-1')
 
-    @responses.activate
     def test_get_marathon_info(self):
         info = self.general_im.get_marathon_info()
         self.assertEqual(info['name'], 'marathon')
         self.assertEqual(info['frameworkId'], 'the-framework-id')
 
-    @responses.activate
     def test_get_worker_info(self):
         worker = self.general_im.get_worker_info('worker-machine-1')
         self.assertEqual(worker['id'], 'worker-machine-id')
 
-    @responses.activate
     def test_get_app_log_info(self):
         [info] = self.general_im.get_app_log_info(self.controller.app_id)
         self.assertEqual(
@@ -63,7 +57,6 @@ class GeneralInfrastructureManagerTest(TestCase):
             }
         )
 
-    @responses.activate
     def test_get_task_log_info(self):
         info = self.general_im.get_task_log_info(
             self.controller.app_id,
@@ -81,12 +74,10 @@ class GeneralInfrastructureManagerTest(TestCase):
             }
         )
 
-    @responses.activate
     def test_controller_infra_manager_get_marathon_app(self):
         app = self.controller_im.get_controller_marathon_app()
         self.assertEqual(app['id'], '/%s' % (self.controller.app_id,))
 
-    @responses.activate
     def test_controller_infra_manager_get_controller_log_info(self):
         [info] = self.controller_im.get_controller_log_info()
         self.assertEqual(
@@ -101,7 +92,6 @@ class GeneralInfrastructureManagerTest(TestCase):
             }
         )
 
-    @responses.activate
     def test_controller_infra_manager_get_controller_task_log_info(self):
         info = self.controller_im.get_controller_task_log_info(
             '%s.the-task-id' % (self.controller.app_id,))
@@ -117,7 +107,6 @@ class GeneralInfrastructureManagerTest(TestCase):
             }
         )
 
-    @responses.activate
     def test_controller_infra_manager_get_controller_non_existent(self):
         self.assertRaises(
             InfrastructureError,
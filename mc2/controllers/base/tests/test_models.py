@@ -1,9 +1,12 @@
 import pytest
 import responses
 
+from django.conf import settings
 from django.contrib.auth.models import User
+from django.test import TestCase
 
-from mc2.controllers.base.tests.base import ControllerBaseTestCase
+from mc2.controllers.base.tests.base import (
+    ControllerBaseTestCase, ResponsesMixin)
 from mc2.controllers.base.models import Controller
 from mc2.controllers.base import exceptions
 from mc2.organizations.models import Organization, OrganizationUserRelation
@@ -19,11 +22,14 @@ class SubTypeB(Controller):
 
 
 @pytest.mark.django_db
-class ModelsTestCase(ControllerBaseTestCase):
+class ModelsTestCase(ResponsesMixin, TestCase, ControllerBaseTestCase):
     fixtures = ['test_users.json', 'test_social_auth.json']
 
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.get(username='testuser')
+
     def setUp(self):
-        self.user = User.objects.get(username='testuser')
         self.maxDiff = None
 
     def test_get_marathon_app_data(self):
@@ -61,7 +67,6 @@ class ModelsTestCase(ControllerBaseTestCase):
             "labels": {"name": "Test App", "org": "test-org"},
         })
 
-    @responses.activate
     def test_get_marathon_app_data_fails_for_xylem_api_error(self):
         controller = self.mk_controller(controller={
             'postgres_db_needed': True})
@@ -71,7 +76,6 @@ class ModelsTestCase(ControllerBaseTestCase):
         with self.assertRaises(exceptions.XylemApiException):
             controller.update_marathon_app()
 
-    @responses.activate
     def test_get_marathon_app_data_fails_for_xylem_api_bad_result(self):
         controller = self.mk_controller(controller={
             'postgres_db_needed': True})
@@ -81,47 +85,67 @@ class ModelsTestCase(ControllerBaseTestCase):
         with self.assertRaises(exceptions.XylemApiException):
             controller.update_marathon_app()
 
-    @responses.activate
     def test_update_marathon_marathon_exception(self):
         controller = self.mk_controller()
         self.mock_update_marathon_app(controller.app_id, 404)
         with self.assertRaises(exceptions.MarathonApiException):
             controller.update_marathon_app()
 
-    @responses.activate
+    def test_update_marathon_non_json_error(self):
+        controller = self.mk_controller()
+        responses.add(
+            responses.PUT, '%s/v2/apps/%s' % (
+                settings.MESOS_MARATHON_HOST, controller.app_id),
+            body='<html>Bad Gateway</html>',
+            content_type='text/html',
+            status=502)
+
+        with self.assertRaises(exceptions.MarathonApiException) as cm:
+            controller.update_marathon_app()
+        self.assertEqual(
+            str(cm.exception),
+            'Update Marathon app failed with response: '
+            '502 - <html>Bad Gateway</html>')
+
     def test_restart_marathon_marathon_exception(self):
         controller = self.mk_controller()
         self.mock_restart_marathon_app(controller.app_id, 404)
         with self.assertRaises(exceptions.MarathonApiException):
             controller.marathon_restart_app()
 
-    @responses.activate
     def test_delete_marathon_marathon_exception(self):
         controller = self.mk_controller()
         self.mock_delete_marathon_app(controller.app_id, 404)
         with self.assertRaises(exceptions.MarathonApiException):
             controller.marathon_destroy_app()
 
-    @responses.activate
     def test_marathon_app_exists(self):
         controller = self.mk_controller()
 
         self.mock_exists_on_marathon(controller.app_id)
         self.assertTrue(controller.exists_on_marathon())
 
-    @responses.activate
     def test_marathon_app_does_not_exist(self):
         controller = self.mk_controller()
 
         self.mock_exists_on_marathon(controller.app_id, 404)
         self.assertFalse(controller.exists_on_marathon())
 
-    @responses.activate
+    def test_marathon_host_follows_settings_override(self):
+        controller = self.mk_controller()
+
+        with self.settings(MESOS_MARATHON_HOST='http://othermarathon:8080'):
+            self.mock_exists_on_marathon(controller.app_id)
+            self.assertTrue(controller.exists_on_marathon())
+
+        self.assertEqual(
+            responses.calls[0].request.url,
+            'http://othermarathon:8080/v2/apps/%s' % controller.app_id)
+
     def test_get_state_display(self):
         controller = self.mk_controller()
         self.assertEquals(controller.get_state_display(), 'Initial')
 
-    @responses.activate
     def test_to_dict(self):
         controller = self.mk_controller()
         self.assertEquals(controller.to_dict(), {
@@ -133,6 +157,17 @@ class ModelsTestCase(ControllerBaseTestCase):
             'marathon_cmd': 'ping',
         })
 
+    def test_save_update_fields_skips_slug(self):
+        controller = self.mk_controller()
+        controller.slug = ''
+        controller.state = 'missing'
+        controller.save(update_fields=['state'])
+        self.assertEqual(controller.slug, '')
+
+        controller = Controller.objects.get(pk=controller.pk)
+        self.assertEqual(controller.state, 'missing')
+        self.assertTrue(controller.slug)
+
     def test_leaf_class_helper(self):
         controller = self.mk_controller()
         self.assertTrue(isinstance(controller, Controller))
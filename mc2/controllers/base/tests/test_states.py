@@ -1,33 +1,34 @@
 import pytest
-import responses
 
 from django.contrib.auth.models import User
+from django.test import TestCase
 
-from mc2.controllers.base.tests.base import ControllerBaseTestCase
+from mc2.controllers.base.tests.base import (
+    ControllerBaseTestCase, ResponsesMixin)
 
 
 @pytest.mark.django_db
-class StatesTestCase(ControllerBaseTestCase):
+class StatesTestCase(ResponsesMixin, TestCase, ControllerBaseTestCase):
     fixtures = ['test_users.json', 'test_social_auth.json']
 
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.get(username='testuser')
+
     def setUp(self):
-        self.user = User.objects.get(username='testuser')
+        self.mock_create_marathon_app()
 
     def test_initial_state(self):
         controller = self.mk_controller()
         self.assertEquals(controller.state, 'initial')
 
-    @responses.activate
     def test_finish_state(self):
-        self.mock_create_marathon_app()
         p = self.mk_controller()
         pw = p.get_builder().workflow
         pw.take_action('create_marathon_app')
         self.assertEquals(p.state, 'done')
 
-    @responses.activate
     def test_next(self):
-        self.mock_create_marathon_app()
         controller = self.mk_controller()
         self.assertEquals(controller.state, 'initial')
 
@@ -35,10 +36,7 @@ class StatesTestCase(ControllerBaseTestCase):
         w.next()
         self.assertEquals(controller.state, 'done')
 
-    @responses.activate
     def test_automation_using_next(self):
-        self.mock_create_marathon_app()
-
         controller = self.mk_controller()
 
         self.assertEquals(controller.state, 'initial')
@@ -48,9 +46,7 @@ class StatesTestCase(ControllerBaseTestCase):
 
         self.assertEquals(controller.state, 'done')
 
-    @responses.activate
     def test_missing_state(self):
-        self.mock_create_marathon_app()
         controller = self.mk_controller()
 
         self.assertEquals(controller.state, 'initial')
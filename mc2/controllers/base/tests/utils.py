@@ -2,6 +2,17 @@ import json
 
 import responses
 
+from django.core.urlresolvers import reverse
+from django.utils.lru_cache import lru_cache
+
+
+@lru_cache(maxsize=256)
+def cached_reverse(viewname, *args):
+    """
+    Memoized ``reverse()`` for URLs that the tests resolve over and over.
+    """
+    return reverse(viewname, args=args)
+
 
 def setup_responses_for_log_tests(controller):
     responses.add(
@@ -1,10 +1,9 @@
-from django.conf.urls import patterns, url
+from django.conf.urls import url
 
 from mc2.controllers.base import views
 
 
-urlpatterns = patterns(
-    '',
+urlpatterns = [
     url(
         r'^add/$',
         views.ControllerCreateView.as_view(),
@@ -41,4 +40,4 @@ urlpatterns = patterns(
         r'^restarthook/(?P<controller_pk>\d+)/(?P<token>[\w-]+)/$',
         views.ControllerWebhookRestartView.as_view(),
         name='webhook_restart'),
-)
+]
@@ -27,15 +27,18 @@ from mc2.controllers.base import exceptions, tasks
 
 @login_required
 def update_marathon_exists_json(request, controller_pk):
-    controller = get_object_or_404(Controller, pk=controller_pk)
+    # Only base controller fields are needed, so skip the polymorphic
+    # query that loads the concrete subclass.
+    controller = get_object_or_404(
+        Controller.objects.non_polymorphic(), pk=controller_pk)
 
     workflow = controller.get_builder().workflow
     if controller.state == 'done' and not controller.exists_on_marathon():
         workflow.take_action('missing')
-        controller.save()
+        controller.save(update_fields=['state', 'modified_at'])
     elif controller.state == 'missing' and controller.exists_on_marathon():
         workflow.take_action('activate')
-        controller.save()
+        controller.save(update_fields=['state', 'modified_at'])
 
     return HttpResponse(
         json.dumps({'state': controller.state}),
@@ -259,7 +262,8 @@ class ControllerRestartView(ControllerViewMixin, View):
     # TODO: Check user permissions
 
     def get(self, request, controller_pk):
-        controller = get_object_or_404(Controller, pk=controller_pk)
+        controller = get_object_or_404(
+            Controller.objects.non_polymorphic(), pk=controller_pk)
         tasks.marathon_restart_app.delay(controller.id)
         messages.info(
             self.request, '%s app restart requested.' % controller.app_id)
@@ -276,7 +280,8 @@ class ControllerDeleteView(ControllerViewMixin, View):
         return super(ControllerDeleteView, self).dispatch(*args, **kwargs)
 
     def post(self, request, controller_pk):
-        controller = get_object_or_404(Controller, pk=controller_pk)
+        controller = get_object_or_404(
+            Controller.objects.non_polymorphic(), pk=controller_pk)
         tasks.marathon_destroy_app.delay(controller.id)
         messages.info(
             self.request, '%s app delete requested.' % controller.app_id)
@@ -299,7 +304,8 @@ class ControllerWebhookRestartView(View):
         return HttpResponseNotAllowed(['POST'])
 
     def post(self, request, controller_pk, token):
-        controller = get_object_or_404(Controller, pk=controller_pk)
+        controller = get_object_or_404(
+            Controller.objects.non_polymorphic(), pk=controller_pk)
         if str(controller.webhook_token) != token:
             return HttpResponseNotFound()
 
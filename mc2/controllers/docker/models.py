@@ -3,7 +3,8 @@ import json
 from django.db import models
 from django.conf import settings
 
-from mc2.controllers.base.models import Controller, EnvVariable, MarathonLabel
+from mc2.controllers.base.models import (
+    AdditionalLink, Controller, EnvVariable, MarathonLabel)
 
 
 def marathon_lb_domains(domains):
@@ -53,19 +54,15 @@ class DockerController(Controller):
             parameters_dict.append({"key": "volume-driver", "value": "xylem"})
             parameters_dict.append({
                 "key": "volume",
-                "value": "%(app_id)s_media:%(path)s" % {
-                    'app_id': self.app_id,
-                    'path':
-                        self.volume_path or
-                        settings.MARATHON_DEFAULT_VOLUME_PATH}})
+                "value": "%s_media:%s" % (
+                    self.app_id,
+                    self.volume_path or settings.MARATHON_DEFAULT_VOLUME_PATH,
+                )})
 
         if parameters_dict:
             docker_dict.update({"parameters": parameters_dict})
 
-        domains = "%(generic_domain)s %(custom)s" % {
-            'generic_domain': self.get_generic_domain(),
-            'custom': self.domain_urls
-        }
+        domains = "%s %s" % (self.get_generic_domain(), self.domain_urls)
         domains = domains.strip()
 
         service_labels = self.get_default_app_labels()
@@ -82,9 +79,8 @@ class DockerController(Controller):
             })
 
         # Update custom labels
-        if self.label_variables.exists():
-            for label in self.label_variables.all():
-                service_labels[label.name] = label.value
+        for label in self.label_variables.all():
+            service_labels[label.name] = label.value
 
         app_data.update({
             "labels": service_labels,
@@ -180,14 +176,16 @@ class DockerController(Controller):
 
         self = cls.objects.create(owner=owner, organization=org, **args)
 
-        for label in labels:
-            MarathonLabel.objects.create(controller=self, **label)
+        MarathonLabel.objects.bulk_create([
+            MarathonLabel(controller=self, **label) for label in labels])
 
-        for key, value in app_data.pop("env", {}).items():
-            EnvVariable.objects.create(controller=self, key=key, value=value)
+        EnvVariable.objects.bulk_create([
+            EnvVariable(controller=self, key=key, value=value)
+            for key, value in app_data.pop("env", {}).items()])
 
-        for name, link in app_data.pop("link", {}).items():
-            EnvVariable.objects.create(controller=self, name=name, link=link)
+        AdditionalLink.objects.bulk_create([
+            AdditionalLink(controller=self, name=name, link=link)
+            for name, link in app_data.pop("link", {}).items()])
 
         # TODO: Better errors:
         # NOTE: Popping these backoffFactor and backoffSeconds because they're
@@ -207,8 +205,16 @@ class DockerController(Controller):
         })
         return data
 
+    @property
+    def generic_domain(self):
+        return '%s.%s' % (self.app_id, settings.HUB_DOMAIN)
+
+    @property
+    def domain_list(self):
+        """
+        The custom domains as a list rather than a space-separated string.
+        """
+        return self.domain_urls.split()
+
     def get_generic_domain(self):
-        return '%(app_id)s.%(hub)s' % {
-            'app_id': self.app_id,
-            'hub': settings.HUB_DOMAIN
-        }
+        return self.generic_domain
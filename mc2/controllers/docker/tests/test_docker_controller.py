@@ -1,21 +1,27 @@
 import pytest
-import responses
 from django.conf import settings
 from django.contrib.auth.models import User
-from django.core.urlresolvers import reverse
+from django.test import TestCase
 
-from mc2.controllers.base.tests.base import ControllerBaseTestCase
+from mc2.controllers.base.models import EnvVariable
+from mc2.controllers.base.tests.base import (
+    ControllerBaseTestCase, ResponsesMixin)
+from mc2.controllers.base.tests.utils import cached_reverse
 from mc2.controllers.docker.models import (
     DockerController, marathon_lb_domains, traefik_domains)
 from mc2.organizations.models import Organization, OrganizationUserRelation
 
 
 @pytest.mark.django_db
-class DockerControllerTestCase(ControllerBaseTestCase):
+class DockerControllerTestCase(
+        ResponsesMixin, TestCase, ControllerBaseTestCase):
     fixtures = ['test_users.json', 'test_social_auth.json']
 
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.get(username='testuser')
+
     def setUp(self):
-        self.user = User.objects.get(username='testuser')
         self.maxDiff = None
 
     def test_get_marathon_app_data(self):
@@ -319,7 +325,6 @@ class DockerControllerTestCase(ControllerBaseTestCase):
             },
         })
 
-    @responses.activate
     def test_get_marathon_app_data_with_postgres_db_needed(self):
         controller = DockerController.objects.create(
             name='Test App',
@@ -366,7 +371,6 @@ class DockerControllerTestCase(ControllerBaseTestCase):
             },
         })
 
-    @responses.activate
     def test_to_dict(self):
         controller = DockerController.objects.create(
             name='Test App',
@@ -387,7 +391,63 @@ class DockerControllerTestCase(ControllerBaseTestCase):
             'marathon_health_check_path': '/health/path/',
         })
 
-    @responses.activate
+    def test_get_generic_domain(self):
+        controller = DockerController.objects.create(
+            name='Test App',
+            owner=self.user,
+            docker_image='docker/image',
+        )
+        self.assertEqual(
+            controller.get_generic_domain(),
+            '%s.%s' % (controller.app_id, settings.HUB_DOMAIN))
+
+        controller.slug = 'renamed-app'
+        self.assertEqual(
+            controller.get_generic_domain(),
+            'renamed-app.%s' % (settings.HUB_DOMAIN,))
+
+    def test_domain_list(self):
+        controller = DockerController.objects.create(
+            name='Test App',
+            owner=self.user,
+            docker_image='docker/image',
+            domain_urls='abc.com  def.co.za',
+        )
+        self.assertEqual(controller.domain_list, ['abc.com', 'def.co.za'])
+
+        controller.domain_urls = 'ghi.co.ng'
+        self.assertEqual(controller.domain_list, ['ghi.co.ng'])
+
+    def test_from_marathon_app_data_with_links(self):
+        controller = DockerController.from_marathon_app_data(
+            self.user, None, {
+                "id": "linked-app",
+                "cpus": 0.1,
+                "mem": 128.0,
+                "instances": 1,
+                "container": {
+                    "type": "DOCKER",
+                    "docker": {
+                        "image": "docker/image",
+                        "forcePullImage": True,
+                        "network": "BRIDGE",
+                    },
+                },
+                "labels": {"name": "Linked App"},
+                "env": {"TEST_KEY": "a test value"},
+                "link": {"Docs": "http://docs.example.com"},
+            })
+
+        self.assertEqual(
+            [(link.name, link.link)
+             for link in controller.additional_link.all()],
+            [("Docs", "http://docs.example.com")])
+        self.assertEqual(
+            [(env.key, env.value) for env in controller.env_variables.all()],
+            [("TEST_KEY", "a test value")])
+        # The link must not have been stored as an envvar.
+        self.assertEqual(EnvVariable.objects.count(), 1)
+
     def test_marathon_cmd_optional(self):
         controller = DockerController.objects.create(
             name='Test App',
@@ -422,7 +482,6 @@ class DockerControllerTestCase(ControllerBaseTestCase):
             },
         })
 
-    @responses.activate
     def test_get_marathon_app_data_using_health_timeout_strings(self):
         controller = DockerController.objects.create(
             name='Test App',
@@ -481,7 +540,6 @@ class DockerControllerTestCase(ControllerBaseTestCase):
                 }]
             })
 
-    @responses.activate
     def test_create_new_controller_with_no_port(self):
         org = Organization.objects.create(name="Foo Org", slug="foo-org")
         OrganizationUserRelation.objects.create(
@@ -489,7 +547,7 @@ class DockerControllerTestCase(ControllerBaseTestCase):
 
         self.client.login(username='testuser2', password='test')
         self.client.get(
-            reverse('organizations:select-active', args=('foo-org',)))
+            cached_reverse('organizations:select-active', 'foo-org'))
 
         self.mock_create_marathon_app()
         self.mock_create_postgres_db(200, {
@@ -519,7 +577,8 @@ class DockerControllerTestCase(ControllerBaseTestCase):
 
         }
 
-        response = self.client.post(reverse('controllers.docker:add'), data)
+        response = self.client.post(
+            cached_reverse('controllers.docker:add'), data)
         self.assertEqual(response.status_code, 302)
 
         controller = DockerController.objects.all().last()
@@ -1,10 +1,9 @@
-from django.conf.urls import patterns, url
+from django.conf.urls import url
 
 from mc2.controllers.docker import views, hidden_import
 
 
-urlpatterns = patterns(
-    '',
+urlpatterns = [
     url(
         r'^add/$',
         views.DockerControllerCreateView.as_view(),
@@ -23,4 +22,4 @@ urlpatterns = patterns(
         r'^hidden_import/$',
         hidden_import.HiddenImportView.as_view(),
         name='hidden_import'),
-)
+]
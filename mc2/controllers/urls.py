@@ -1,10 +1,9 @@
-from django.conf.urls import patterns, include, url
+from django.conf.urls import include, url
 from django.contrib import admin
 
 admin.autodiscover()
 
-urlpatterns = patterns(
-    '',
+urlpatterns = [
     url(
         r'^base/',
         include('mc2.controllers.base.urls', namespace='base')),
@@ -12,4 +11,4 @@ urlpatterns = patterns(
         r'^docker/',
         include(
             'mc2.controllers.docker.urls', namespace='controllers.docker')),
-)
+]
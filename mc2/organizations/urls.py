@@ -1,10 +1,9 @@
-from django.conf.urls import patterns, url
+from django.conf.urls import url
 
 from mc2.organizations import views
 
 
-urlpatterns = patterns(
-    '',
+urlpatterns = [
     url(
         r'^(?P<slug>[\w-]+)/select/$',
         views.SelectActiveOrganizationView.as_view(),
@@ -20,4 +19,4 @@ urlpatterns = patterns(
         views.EditOrganizationView.as_view(),
         name='edit',
     ),
-)
+]
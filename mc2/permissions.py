@@ -15,15 +15,6 @@ def get_app_id_from_domain(domain):
 
 def org_permissions(user, service):
     if user and service:
-        domain = urlparse(service).hostname
-        app_id = get_app_id_from_domain(domain)
-        if app_id:
-            controller = DockerController.objects.filter(
-                Q(domain_urls__contains=domain) | Q(slug=app_id)).first()
-        else:
-            controller = DockerController.objects.filter(
-                domain_urls__contains=domain).first()
-
         # super users have universal access
         if user.is_superuser:
             return {
@@ -34,6 +25,16 @@ def org_permissions(user, service):
                 'service_name': service,
                 'groups': []}
 
+        domain = urlparse(service).hostname
+        app_id = get_app_id_from_domain(domain)
+        controllers = DockerController.objects.select_related('organization')
+        if app_id:
+            controller = controllers.filter(
+                Q(domain_urls__contains=domain) | Q(slug=app_id)).first()
+        else:
+            controller = controllers.filter(
+                domain_urls__contains=domain).first()
+
         if controller:
             # org admins have super user access
             if controller.organization.has_admin(user) or \
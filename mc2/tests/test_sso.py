@@ -115,6 +115,14 @@ class CustomAttributesTest(TestCase):
         self.assertEqual(attr['has_perm'], True)
         self.assertEqual(attr['is_admin'], True)
 
+    def test_super_user_access_does_not_query_controllers(self):
+        joe = User.objects.create_superuser('joe', 'joe@email.com', '1234')
+
+        with self.assertNumQueries(0):
+            attr = permissions.org_permissions(joe, 'http://foobar.com/')
+        self.assertEqual(attr['has_perm'], True)
+        self.assertEqual(attr['is_admin'], True)
+
     def test_user_in_org_must_have_access(self):
         org = Organization.objects.create(name='Test', slug='test')
         OrganizationUserRelation.objects.create(
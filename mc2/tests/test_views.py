@@ -1,11 +1,11 @@
 import pytest
-import responses
 from django.test.client import Client
 from django.test import TestCase
-from django.core.urlresolvers import reverse
 from django.contrib.auth.models import User
 from mc2.controllers.base.models import Controller
-from mc2.controllers.base.tests.base import ControllerBaseTestCase
+from mc2.controllers.base.tests.base import (
+    ControllerBaseTestCase, ResponsesMixin)
+from mc2.controllers.base.tests.utils import cached_reverse
 from mc2.controllers.docker.models import DockerController
 from mc2.organizations.models import Organization
 from mc2 import forms
@@ -17,21 +17,20 @@ class UnknownController(Controller):
 
 
 @pytest.mark.django_db
-class ViewsTestCase(ControllerBaseTestCase):
+class ViewsTestCase(ResponsesMixin, TestCase, ControllerBaseTestCase):
     fixtures = [
         'test_users.json', 'test_social_auth.json', 'test_organizations.json']
 
-    def setUp(self):
-        self.client = Client()
-        self.client.login(username='testuser', password='test')
-        self.user = User.objects.get(username='testuser')
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.get(username='testuser')
+        cls.user2 = User.objects.get(username='testuser2')
 
-    @responses.activate
     def test_homepage(self):
         controller = self.mk_controller()
 
-        self.client.login(username='testuser2', password='test')
-        resp = self.client.get(reverse('home'))
+        self.client.force_login(self.user2)
+        resp = self.client.get(cached_reverse('home'))
 
         self.assertContains(resp, 'Test App')
         self.assertContains(resp, 'Status')
@@ -43,7 +42,6 @@ class ViewsTestCase(ControllerBaseTestCase):
             controller.id)
         controller.delete()
 
-    @responses.activate
     def test_dashboard(self):
         org = Organization.objects.get(slug='foo-org')
         self.mk_controller(controller={
@@ -60,8 +58,8 @@ class ViewsTestCase(ControllerBaseTestCase):
             'marathon_mem': 384.0,
             'organization': org})
 
-        self.client.login(username='testuser2', password='test')
-        resp = self.client.get(reverse('dashboard'))
+        self.client.force_login(self.user2)
+        resp = self.client.get(cached_reverse('dashboard'))
 
         self.assertContains(resp, '>2.38 GB</span>')
         self.assertContains(resp, '<td>4</td>')
@@ -69,9 +67,9 @@ class ViewsTestCase(ControllerBaseTestCase):
         self.assertContains(resp, '<td>0.5</td>')
 
         self.client.get(
-            reverse('organizations:select-active', args=('foo-org',)))
+            cached_reverse('organizations:select-active', 'foo-org'))
 
-        resp = self.client.get(reverse('dashboard'))
+        resp = self.client.get(cached_reverse('dashboard'))
 
         self.assertContains(resp, '>2.38 GB</span>')
         self.assertContains(resp, '<td>512 MB</td>')
@@ -79,7 +77,6 @@ class ViewsTestCase(ControllerBaseTestCase):
         self.assertContains(resp, '<td>384 MB</td>')
         self.assertNotContains(resp, '<td>256 MB</td>')
 
-    @responses.activate
     def test_homepage_with_docker_controller(self):
         DockerController.objects.create(
             name='Test Docker App',
@@ -90,8 +87,8 @@ class ViewsTestCase(ControllerBaseTestCase):
             marathon_health_check_path='/health/path/'
         )
 
-        self.client.login(username='testuser2', password='test')
-        resp = self.client.get(reverse('home'))
+        self.client.force_login(self.user2)
+        resp = self.client.get(cached_reverse('home'))
 
         self.assertContains(resp, 'Test Docker App')
         self.assertContains(resp, 'Status')
@@ -99,7 +96,6 @@ class ViewsTestCase(ControllerBaseTestCase):
         self.assertContains(resp, 'Edit')
         self.assertContains(resp, 'Delete')
 
-    @responses.activate
     def test_template_tag_fallback(self):
         controller = UnknownController.objects.create(
             owner=self.user,
@@ -107,8 +103,8 @@ class ViewsTestCase(ControllerBaseTestCase):
             marathon_cmd='ping'
         )
 
-        self.client.login(username='testuser2', password='test')
-        resp = self.client.get(reverse('home'))
+        self.client.force_login(self.user2)
+        resp = self.client.get(cached_reverse('home'))
 
         self.assertContains(resp, 'Test App')
 
@@ -127,20 +123,20 @@ class CreateAccountViewTest(TestCase):
         self.client = Client()
 
     def test_login(self):
-        response = self.client.get(reverse('login'))
+        response = self.client.get(cached_reverse('login'))
         self.assertContains(response, 'Forgotten your password')
         self.assertContains(response, 'Create account')
 
     def test_create_account_view(self):
         response = self.client.post(
-            reverse('create_account'),
+            cached_reverse('create_account'),
             data={'username': 'tester', 'password1': 'foo',
                   'password2': 'foo', 'first_name': 'foo',
                   'last_name': 'foo', 'email': 'foo@example.com'})
 
         self.assertEqual(response.status_code, 302)
         self.assertEqual(response['Location'],
-                         'http://testserver%s' % reverse('home'))
+                         'http://testserver%s' % cached_reverse('home'))
         self.assertEqual(User.objects.count(), 2)
 
     def test_create_new_account_form_unique_email(self):
@@ -172,7 +168,7 @@ class CreateAccountViewTest(TestCase):
 
     def test_username_field_is_required(self):
         response = self.client.post(
-            reverse('create_account'),
+            cached_reverse('create_account'),
             data={'password1': 'foo',
                   'password2': 'foo',
                   'first_name': 'foo',
@@ -184,7 +180,7 @@ class CreateAccountViewTest(TestCase):
 
     def test_password_field_is_required(self):
         response = self.client.post(
-            reverse('create_account'),
+            cached_reverse('create_account'),
             data={'username': 'foo',
                   'first_name': 'foo',
                   'last_name': 'foo',
@@ -195,7 +191,7 @@ class CreateAccountViewTest(TestCase):
 
     def test_email_field_is_required(self):
         response = self.client.post(
-            reverse('create_account'),
+            cached_reverse('create_account'),
             data={'username': 'tester',
                   'password1': 'foo',
                   'password2': 'foo',
@@ -207,7 +203,7 @@ class CreateAccountViewTest(TestCase):
 
     def test_invalid_email(self):
         response = self.client.post(
-            reverse('create_account'),
+            cached_reverse('create_account'),
             data={'username': 'tester',
                   'password1': 'foo',
                   'password2': 'foo',
@@ -220,7 +216,7 @@ class CreateAccountViewTest(TestCase):
 
     def test_valid_email(self):
         self.client.post(
-            reverse('user_settings'),
+            cached_reverse('user_settings'),
             data={'username': 'tester',
                   'password1': 'foo',
                   'password2': 'foo',
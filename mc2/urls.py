@@ -1,13 +1,13 @@
-from django.conf.urls import patterns, url, include
+from django.conf.urls import url, include
 from django.contrib.auth.decorators import login_required
+from django.contrib.auth.views import logout_then_login
 from django.contrib import admin
 from mc2 import views
 
 admin.autodiscover()
 
 
-urlpatterns = patterns(
-    '',
+urlpatterns = [
     url(
         r'^$',
         views.HomepageView.as_view(),
@@ -24,7 +24,7 @@ urlpatterns = patterns(
     url(r'', include('mama_cas.urls')),
     url(
         r'^logout/$',
-        'django.contrib.auth.views.logout_then_login',
+        logout_then_login,
         name='logout'
     ),
     url('^', include('django.contrib.auth.urls')),
@@ -42,4 +42,4 @@ urlpatterns = patterns(
     url(
         r'^social/',
         include('social.apps.django_app.urls', namespace='social')),
-)
+]
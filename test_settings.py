@@ -12,6 +12,9 @@ DATABASES = {
         'PASSWORD': '',
         'HOST': '',
         'PORT': '',
+        # No test relies on serialized_rollback, so skip dumping the whole
+        # test database to a string every time it is created.
+        'TEST': {'SERIALIZE': False},
     }
 }
 
@@ -24,6 +27,12 @@ CACHES = {
 DEBUG = True
 CELERY_ALWAYS_EAGER = True
 
+# MD5 keeps password hashing cheap in tests; the user fixtures are
+# stored with MD5 hashes too.
+PASSWORD_HASHERS = (
+    'django.contrib.auth.hashers.MD5PasswordHasher',
+)
+
 
 def scratchpath(*paths):
     return abspath('.scratchpath', *paths)  # noqa